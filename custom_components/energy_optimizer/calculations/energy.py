@@ -137,7 +137,7 @@ def calculate_sufficiency_window(
 ) -> tuple[float, float, float, int, bool]:
     """Calculate required energy and PV sufficiency window details."""
     hour_window = build_hour_window(start_hour, end_hour)
-    required_kwh = sum(
+    demand_by_hour = [
         hourly_demand(
             hour,
             hourly_usage=hourly_usage,
@@ -146,37 +146,23 @@ def calculate_sufficiency_window(
             margin=margin,
         )
         for hour in hour_window
-    )
+    ]
+    required_kwh = sum(demand_by_hour)
 
-    sufficiency_hour: int | None = None
-    for hour in hour_window:
-        if pv_forecast_hourly.get(hour, 0.0) >= hourly_demand(
-            hour,
-            hourly_usage=hourly_usage,
-            heat_pump_hourly=heat_pump_hourly,
-            losses_hourly=losses_hourly,
-            margin=margin,
-        ):
-            sufficiency_hour = hour
+    sufficiency_index = len(hour_window)
+    for index, hour in enumerate(hour_window):
+        if pv_forecast_hourly.get(hour, 0.0) >= demand_by_hour[index]:
+            sufficiency_index = index
             break
 
-    sufficiency_reached = sufficiency_hour is not None
-    if sufficiency_hour is None:
-        sufficiency_hour = end_hour
+    sufficiency_reached = sufficiency_index < len(hour_window)
+    sufficiency_hour = hour_window[sufficiency_index] if sufficiency_reached else end_hour
 
-    required_sufficiency_kwh = 0.0
-    pv_sufficiency_kwh = 0.0
-    for hour in hour_window:
-        if sufficiency_reached and hour == sufficiency_hour:
-            break
-        required_sufficiency_kwh += hourly_demand(
-            hour,
-            hourly_usage=hourly_usage,
-            heat_pump_hourly=heat_pump_hourly,
-            losses_hourly=losses_hourly,
-            margin=margin,
-        )
-        pv_sufficiency_kwh += pv_forecast_hourly.get(hour, 0.0)
+    required_sufficiency_kwh = sum(demand_by_hour[:sufficiency_index], 0.0)
+    pv_sufficiency_kwh = sum(
+        (pv_forecast_hourly.get(hour, 0.0) for hour in hour_window[:sufficiency_index]),
+        0.0,
+    )
 
     return (
         required_kwh,
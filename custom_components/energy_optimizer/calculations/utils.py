@@ -1,6 +1,7 @@
 """Calculation utilities for Energy Optimizer."""
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
 from typing import Any
 
 
@@ -80,6 +81,19 @@ def is_valid_percentage(value: float) -> bool:
     """
     return 0 <= value <= 100
 
+def sum_hourly_window(hourly_values: Sequence[float], hours: Iterable[int]) -> float:
+    """Sum a 24-element hourly array over the given hours.
+
+    Args:
+        hourly_values: Per-hour values indexed by hour (0-23)
+        hours: Hours to include, e.g. from build_hour_window
+
+    Returns:
+        Sum of the selected hourly values
+    """
+    return sum(map(hourly_values.__getitem__, hours))
+
+
 def build_hourly_usage_array(
     config: dict[str, Any],
     hass_states_get: Any,
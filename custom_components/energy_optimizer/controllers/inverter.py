@@ -33,6 +33,11 @@ async def _call_service(
     )
 
 
+def program_soc_needs_write(current_value: float | None, value: float) -> bool:
+    """Return whether set_program_soc would change the current program SOC."""
+    return current_value is None or float(ceil(value)) != current_value
+
+
 async def set_program_soc(
     hass: HomeAssistant,
     entity_id: str | None,
@@ -17,13 +17,14 @@ from ..decision_engine.common import (
     BatteryConfig,
     ChargeAction,
     EnergyBalance,
+    EntityState,
     ForecastData,
     _compute_arbitrage_from_cap,
     build_afternoon_charge_outcome,
     build_no_action_outcome,
     calculate_target_soc_from_needed_reserve,
     get_entry_data,
-    get_required_prog4_soc_state,
+    get_required_prog_soc_state,
     handle_no_action_soc_update,
 )
 from ..helpers import (
@@ -49,9 +50,9 @@ class AfternoonChargeStrategy(BaseChargeStrategy):
         """Scenario display name."""
         return "Afternoon Grid Charge"
 
-    def _get_prog_soc_state(self) -> tuple[str, float] | None:
+    def _get_prog_soc_state(self) -> EntityState | None:
         """Resolve afternoon Program 4 SOC state."""
-        return get_required_prog4_soc_state(self.hass, self.config)
+        return get_required_prog_soc_state(self.hass, self.config, 4)
 
     def _resolve_forecast_params(self) -> tuple[int, int, dict[str, object]]:
         """Resolve afternoon forecast time window and kwargs."""
@@ -15,6 +15,7 @@ from .common import (
     BatteryConfig,
     ChargeAction,
     EnergyBalance,
+    EntityState,
     ForecastData,
     calculate_charge_action,
     gather_forecasts,
@@ -64,7 +65,7 @@ class BaseChargeStrategy(ABC):
         """Scenario display name used in outcomes and logs."""
 
     @abstractmethod
-    def _get_prog_soc_state(self) -> tuple[str, float] | None:
+    def _get_prog_soc_state(self) -> EntityState | None:
         """Return configured program SOC entity and current value."""
 
     @abstractmethod
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import dataclasses
 import logging
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
 
 from homeassistant.util import dt as dt_util
 
@@ -20,8 +20,8 @@ from ..calculations.energy import (
     calculate_sufficiency_window,
     hourly_demand,
 )
-from ..calculations.utils import build_hourly_usage_array
-from ..controllers.inverter import set_program_soc
+from ..calculations.utils import build_hourly_usage_array, sum_hourly_window
+from ..controllers.inverter import program_soc_needs_write, set_program_soc
 from ..const import (
     CONF_BATTERY_CAPACITY_AH,
     CONF_BATTERY_EFFICIENCY,
@@ -53,6 +53,20 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+_PROG_SOC_SLOTS: dict[int, str] = {
+    2: CONF_PROG2_SOC_ENTITY,
+    3: CONF_PROG3_SOC_ENTITY,
+    4: CONF_PROG4_SOC_ENTITY,
+    5: CONF_PROG5_SOC_ENTITY,
+}
+
+
+class EntityState(NamedTuple):
+    """Entity id and parsed float value of a required state."""
+
+    entity_id: str
+    value: float
+
 
 @dataclasses.dataclass(frozen=True, slots=True)
 class BatteryConfig:
@@ -148,8 +162,11 @@ async def gather_forecasts(
         hass.states.get,
         daily_load_fallback=None,
     )
-    usage_kwh = sum(hourly_usage[hour] for hour in hour_window)
+    usage_kwh = sum_hourly_window(hourly_usage, hour_window)
 
+    # Only the heat pump forecast awaits I/O. PV and losses are synchronous
+    # reads of hass.states, which must stay on the event loop, so there is
+    # nothing to run concurrently with the service call.
     heat_pump_kwh, heat_pump_hourly = await get_heat_pump_forecast_window(
         hass,
         config,
@@ -308,8 +325,7 @@ async def handle_no_action_soc_update(
     outcome: DecisionOutcome,
 ) -> None:
     """Handle no-action path: conditionally update program SOC and log outcome."""
-    entities_changed: list[dict[str, float | str]] = []
-    if abs(target_soc - current_prog_soc) > 0.01:
+    if program_soc_needs_write(current_prog_soc, target_soc):
         await set_program_soc(
             hass,
             prog_soc_entity,
@@ -318,10 +334,7 @@ async def handle_no_action_soc_update(
             logger=_LOGGER,
             context=integration_context,
         )
-        entities_changed.append({"entity_id": prog_soc_entity, "value": target_soc})
-
-    if entities_changed:
-        outcome.entities_changed = entities_changed
+        outcome.entities_changed = [{"entity_id": prog_soc_entity, "value": target_soc}]
 
     await log_decision_unified(
         hass, entry, outcome, context=integration_context, logger=_LOGGER
@@ -342,103 +355,52 @@ def resolve_entry(hass: HomeAssistant, entry_id: str | None) -> ConfigEntry | No
         return entry
 
     entries = hass.config_entries.async_entries(DOMAIN)
+    if len(entries) == 1:
+        return entries[0]
     if not entries:
         _LOGGER.error("No Energy Optimizer configuration found")
         return None
-    if len(entries) > 1:
-        _LOGGER.error(
-            "Multiple %s config entries exist; service call must include entry_id",
-            DOMAIN,
-        )
-        return None
-
-    return entries[0]
+    _LOGGER.error(
+        "Multiple %s config entries exist; service call must include entry_id",
+        DOMAIN,
+    )
+    return None
 
 
 def get_entry_data(hass: HomeAssistant, entry_id: str) -> dict[str, Any] | None:
     """Return runtime integration data dict for an entry, when available."""
-    if (
-        DOMAIN in hass.data
-        and entry_id in hass.data[DOMAIN]
-        and isinstance(hass.data[DOMAIN][entry_id], dict)
-    ):
-        return hass.data[DOMAIN][entry_id]
+    entry_data = hass.data.get(DOMAIN, {}).get(entry_id)
+    if isinstance(entry_data, dict):
+        return entry_data
     return None
 
 
-def get_required_prog2_soc_state(
-    hass: HomeAssistant, config: dict[str, object]
-) -> tuple[str, float] | None:
-    """Return Program 2 SOC entity id and value when available."""
-    prog2_soc_entity = config.get(CONF_PROG2_SOC_ENTITY)
-    prog2_soc_value = get_required_float_state(
-        hass,
-        prog2_soc_entity,
-        entity_name="Program 2 SOC entity",
-    )
-    if prog2_soc_value is None:
-        return None
-    return str(prog2_soc_entity), prog2_soc_value
-
-
-def get_required_prog3_soc_state(
-    hass: HomeAssistant, config: dict[str, object]
-) -> tuple[str, float] | None:
-    """Return Program 3 SOC entity id and value when available."""
-    prog3_soc_entity = config.get(CONF_PROG3_SOC_ENTITY)
-    prog3_soc_value = get_required_float_state(
-        hass,
-        prog3_soc_entity,
-        entity_name="Program 3 SOC entity",
-    )
-    if prog3_soc_value is None:
-        return None
-    return str(prog3_soc_entity), prog3_soc_value
-
-
-def get_required_prog4_soc_state(
-    hass: HomeAssistant, config: dict[str, object]
-) -> tuple[str, float] | None:
-    """Return Program 4 SOC entity id and value when available."""
-    prog4_soc_entity = config.get(CONF_PROG4_SOC_ENTITY)
-    prog4_soc_value = get_required_float_state(
-        hass,
-        prog4_soc_entity,
-        entity_name="Program 4 SOC entity",
-    )
-    if prog4_soc_value is None:
+def _get_required_entity_state(
+    hass: HomeAssistant, entity_id: object, entity_name: str
+) -> EntityState | None:
+    """Return configured entity id and float value when available."""
+    value = get_required_float_state(hass, entity_id, entity_name=entity_name)
+    if value is None:
         return None
-    return str(prog4_soc_entity), prog4_soc_value
+    return EntityState(entity_id if isinstance(entity_id, str) else str(entity_id), value)
 
 
-def get_required_prog5_soc_state(
-    hass: HomeAssistant, config: dict[str, object]
-) -> tuple[str, float] | None:
-    """Return Program 5 SOC entity id and value when available."""
-    prog5_soc_entity = config.get(CONF_PROG5_SOC_ENTITY)
-    prog5_soc_value = get_required_float_state(
-        hass,
-        prog5_soc_entity,
-        entity_name="Program 5 SOC entity",
+def get_required_prog_soc_state(
+    hass: HomeAssistant, config: dict[str, object], slot: int
+) -> EntityState | None:
+    """Return program SOC entity id and value for a slot when available."""
+    return _get_required_entity_state(
+        hass, config.get(_PROG_SOC_SLOTS[slot]), f"Program {slot} SOC entity"
     )
-    if prog5_soc_value is None:
-        return None
-    return str(prog5_soc_entity), prog5_soc_value
 
 
 def get_required_current_soc_state(
     hass: HomeAssistant, config: dict[str, object]
-) -> tuple[str, float] | None:
+) -> EntityState | None:
     """Return battery SOC entity id and value when available."""
-    battery_soc_entity = config.get(CONF_BATTERY_SOC_SENSOR)
-    current_soc = get_required_float_state(
-        hass,
-        battery_soc_entity,
-        entity_name="Battery SOC sensor",
+    return _get_required_entity_state(
+        hass, config.get(CONF_BATTERY_SOC_SENSOR), "Battery SOC sensor"
     )
-    if current_soc is None:
-        return None
-    return str(battery_soc_entity), current_soc
 
 
 def build_charge_outcome_base(
@@ -495,7 +457,7 @@ def build_charge_outcome_base(
     if arbitrage_kwh is not None:
         details["arbitrage_kwh"] = round(arbitrage_kwh, 2)
     if details_extra:
-        details.update(details_extra)
+        details |= details_extra
 
     return DecisionOutcome(
         scenario=scenario,
@@ -530,8 +492,9 @@ def build_morning_charge_outcome(
         "gap_sufficiency_kwh": round(gap_sufficiency_kwh, 2),
         "sufficiency_hour": sufficiency.sufficiency_hour,
         "sufficiency_reached": sufficiency.sufficiency_reached,
-        **(arbitrage_details or {}),
     }
+    if arbitrage_details:
+        details_extra |= arbitrage_details
 
     return build_charge_outcome_base(
         scenario=scenario,
@@ -559,11 +522,6 @@ def build_afternoon_charge_outcome(
     pv_compensation_factor: float | None,
 ) -> DecisionOutcome:
     """Build an afternoon charge decision outcome."""
-    details_extra = {
-        "window_start_hour": forecasts.start_hour,
-        "window_end_hour": forecasts.end_hour,
-        **(arbitrage_details or {}),
-    }
     return build_charge_outcome_base(
         scenario=scenario,
         action=action,
@@ -573,7 +531,7 @@ def build_afternoon_charge_outcome(
         efficiency=efficiency,
         pv_compensation_factor=pv_compensation_factor,
         arbitrage_kwh=arbitrage_kwh,
-        details_extra=details_extra,
+        details_extra=arbitrage_details,
     )
 
 
@@ -669,7 +627,7 @@ def build_evening_sell_outcome(
             "pv_forecast_kwh": round(pv_forecast_kwh, 2),
             "heat_pump_kwh": round(heat_pump_kwh, 2),
             "losses_kwh": round(losses_kwh, 2),
-            "export_power_w": round(export_power_w, 0),
+            "export_power_w": export_power_w,
             price_metric_key: round(evening_price, 2),
             threshold_metric_key: round(threshold_price, 2),
             "start_hour": start_hour,
@@ -726,7 +684,7 @@ def build_surplus_sell_outcome(
             "heat_pump_tomorrow_kwh": round(heat_pump_tomorrow_kwh, 2),
             "sufficiency_hour": sufficiency_hour,
             "sufficiency_reached": sufficiency_reached,
-            "export_power_w": round(export_power_w, 0),
+            "export_power_w": export_power_w,
             price_metric_key: round(evening_price, 2),
             threshold_metric_key: round(threshold_price, 2),
         },
@@ -1,6 +1,7 @@
 """Evening behavior decision logic (overnight schedule)."""
 from __future__ import annotations
 
+import asyncio
 import dataclasses
 import logging
 from typing import TYPE_CHECKING, Any
@@ -33,7 +34,11 @@ from ..const import (
     DEFAULT_BALANCING_PV_THRESHOLD,
     DEFAULT_MAX_CHARGE_CURRENT,
 )
-from ..controllers.inverter import set_max_charge_current, set_program_soc
+from ..controllers.inverter import (
+    program_soc_needs_write,
+    set_max_charge_current,
+    set_program_soc,
+)
 from ..decision_engine.common import (
     get_battery_config,
     get_entry_data,
@@ -94,17 +99,59 @@ def _coerce_float(value: object | None) -> float | None:
         return None
 
 
+def _read_float_or_warn(
+    hass: HomeAssistant, entity_id: str | None, label: str
+) -> float | None:
+    """Read a float entity state, warning when the state cannot be parsed."""
+    value, raw, error = get_float_state_info(hass, entity_id)
+    if error == "invalid":
+        _LOGGER.warning("Could not parse %s: %s", label, raw)
+    return value
+
+
+async def _set_program_soc_if_changed(
+    hass: HomeAssistant,
+    entity_id: str | None,
+    value: float,
+    *,
+    entry: ConfigEntry,
+    logger: logging.Logger,
+    context: Context,
+) -> bool:
+    """Set a program SOC entity unless it already holds the written value.
+
+    Returns whether a write was issued.
+    """
+    if not entity_id:
+        return False
+    current_value, _, _ = get_float_state_info(hass, entity_id)
+    if not program_soc_needs_write(current_value, value):
+        logger.debug("%s already at %s%%, skipping write", entity_id, current_value)
+        return False
+    await set_program_soc(
+        hass, entity_id, value, entry=entry, logger=logger, context=context
+    )
+    return True
+
+
+def _written_entities(
+    writes: tuple[tuple[str | None, float, bool], ...],
+) -> list[dict[str, Any]]:
+    """Return entities_changed entries for the program SOC writes issued."""
+    return [
+        {"entity_id": entity_id, "value": value}
+        for entity_id, value, written in writes
+        if written
+    ]
+
+
 def _update_pv_compensation(
     hass: HomeAssistant,
     config: dict[str, Any],
     *,
-    entry_id: str,
+    entry_data: dict[str, Any],
 ) -> dict[str, float | None]:
     """Update PV compensation sensor and return details for logging."""
-    entry_data = get_entry_data(hass, entry_id)
-    if entry_data is None:
-        return {}
-
     pv_compensation_sensor = entry_data.get("pv_forecast_compensation_sensor")
     if pv_compensation_sensor is None:
         return {}
@@ -113,27 +160,12 @@ def _update_pv_compensation(
     forecast_yesterday = _coerce_float(previous_attrs.get("forecast_today_kwh"))
     production_yesterday = _coerce_float(previous_attrs.get("production_today_kwh"))
 
-    forecast_today = None
-    forecast_today_entity = config.get(CONF_PV_FORECAST_TODAY)
-    if forecast_today_entity:
-        forecast_value, forecast_raw, forecast_error = get_float_state_info(
-            hass, forecast_today_entity
-        )
-        if forecast_error is None and forecast_value is not None:
-            forecast_today = forecast_value
-        elif forecast_error == "invalid":
-            _LOGGER.warning("Could not parse PV forecast today: %s", forecast_raw)
-
-    production_today = None
-    production_entity = config.get(CONF_PV_PRODUCTION_SENSOR)
-    if production_entity:
-        production_value, production_raw, production_error = get_float_state_info(
-            hass, production_entity
-        )
-        if production_error is None and production_value is not None:
-            production_today = production_value
-        elif production_error == "invalid":
-            _LOGGER.warning("Could not parse PV production today: %s", production_raw)
+    forecast_today = _read_float_or_warn(
+        hass, config.get(CONF_PV_FORECAST_TODAY), "PV forecast today"
+    )
+    production_today = _read_float_or_warn(
+        hass, config.get(CONF_PV_PRODUCTION_SENSOR), "PV production today"
+    )
 
     pv_compensation_sensor.update_compensation(
         forecast_today_kwh=forecast_today,
@@ -188,37 +220,39 @@ async def _handle_balancing(
     )
 
     max_charge_current = DEFAULT_MAX_CHARGE_CURRENT
-    await set_program_soc(
-        hass,
-        prog1_soc,
-        max_soc,
-        entry=entry,
-        logger=_LOGGER,
-        context=integration_context,
-    )
-    await set_program_soc(
-        hass,
-        prog2_soc,
-        max_soc,
-        entry=entry,
-        logger=_LOGGER,
-        context=integration_context,
-    )
-    await set_program_soc(
-        hass,
-        prog6_soc,
-        max_soc,
-        entry=entry,
-        logger=_LOGGER,
-        context=integration_context,
-    )
-    await set_max_charge_current(
-        hass,
-        max_charge_current_entity,
-        max_charge_current,
-        entry=entry,
-        logger=_LOGGER,
-        context=integration_context,
+    prog1_written, prog2_written, prog6_written, _ = await asyncio.gather(
+        _set_program_soc_if_changed(
+            hass,
+            prog1_soc,
+            max_soc,
+            entry=entry,
+            logger=_LOGGER,
+            context=integration_context,
+        ),
+        _set_program_soc_if_changed(
+            hass,
+            prog2_soc,
+            max_soc,
+            entry=entry,
+            logger=_LOGGER,
+            context=integration_context,
+        ),
+        _set_program_soc_if_changed(
+            hass,
+            prog6_soc,
+            max_soc,
+            entry=entry,
+            logger=_LOGGER,
+            context=integration_context,
+        ),
+        set_max_charge_current(
+            hass,
+            max_charge_current_entity,
+            max_charge_current,
+            entry=entry,
+            logger=_LOGGER,
+            context=integration_context,
+        ),
     )
 
     summary = "Balancing enabled"
@@ -236,9 +270,13 @@ async def _handle_balancing(
             **pv_compensation_details,
         },
         entities_changed=[
-            {"entity_id": prog1_soc, "value": max_soc},
-            {"entity_id": prog2_soc, "value": max_soc},
-            {"entity_id": prog6_soc, "value": max_soc},
+            *_written_entities(
+                (
+                    (prog1_soc, max_soc, prog1_written),
+                    (prog2_soc, max_soc, prog2_written),
+                    (prog6_soc, max_soc, prog6_written),
+                )
+            ),
             {"entity_id": max_charge_current_entity, "value": max_charge_current},
         ],
     )
@@ -295,21 +333,23 @@ async def _handle_preservation(
         battery_space,
     )
 
-    await set_program_soc(
-        hass,
-        prog1_soc,
-        morning_target_soc,
-        entry=entry,
-        logger=_LOGGER,
-        context=integration_context,
-    )
-    await set_program_soc(
-        hass,
-        prog6_soc,
-        morning_target_soc,
-        entry=entry,
-        logger=_LOGGER,
-        context=integration_context,
+    prog1_written, prog6_written = await asyncio.gather(
+        _set_program_soc_if_changed(
+            hass,
+            prog1_soc,
+            morning_target_soc,
+            entry=entry,
+            logger=_LOGGER,
+            context=integration_context,
+        ),
+        _set_program_soc_if_changed(
+            hass,
+            prog6_soc,
+            morning_target_soc,
+            entry=entry,
+            logger=_LOGGER,
+            context=integration_context,
+        ),
     )
 
     summary = "Battery preservation mode"
@@ -344,10 +384,12 @@ async def _handle_preservation(
             "morning_needed_reserve_kwh": round(morning_needed_reserve_kwh, 2),
             **pv_compensation_details,
         },
-        entities_changed=[
-            {"entity_id": prog1_soc, "value": morning_target_soc},
-            {"entity_id": prog6_soc, "value": morning_target_soc},
-        ],
+        entities_changed=_written_entities(
+            (
+                (prog1_soc, morning_target_soc, prog1_written),
+                (prog6_soc, morning_target_soc, prog6_written),
+            )
+        ),
     )
     await log_decision_unified(
         hass, entry, outcome, context=integration_context, logger=_LOGGER
@@ -381,13 +423,7 @@ async def _handle_normal_restoration(
     sufficiency_reached: bool,
 ) -> bool:
     """Handle normal restoration scenario and return whether it was activated."""
-    current_prog6_soc = None
-    if prog6_soc:
-        prog6_value, prog6_raw, prog6_error = get_float_state_info(hass, prog6_soc)
-        if prog6_error is None and prog6_value is not None:
-            current_prog6_soc = prog6_value
-        elif prog6_error == "invalid":
-            _LOGGER.warning("Could not parse prog6 SOC: %s", prog6_raw)
+    current_prog6_soc = _read_float_or_warn(hass, prog6_soc, "prog6 SOC")
 
     if current_prog6_soc is None or current_prog6_soc <= min_soc:
         return False
@@ -398,29 +434,32 @@ async def _handle_normal_restoration(
         min_soc,
     )
 
-    await set_program_soc(
-        hass,
-        prog1_soc,
-        min_soc,
-        entry=entry,
-        logger=_LOGGER,
-        context=integration_context,
-    )
-    await set_program_soc(
-        hass,
-        prog2_soc,
-        min_soc - 4,
-        entry=entry,
-        logger=_LOGGER,
-        context=integration_context,
-    )
-    await set_program_soc(
-        hass,
-        prog6_soc,
-        min_soc,
-        entry=entry,
-        logger=_LOGGER,
-        context=integration_context,
+    prog1_written, prog2_written, _ = await asyncio.gather(
+        _set_program_soc_if_changed(
+            hass,
+            prog1_soc,
+            min_soc,
+            entry=entry,
+            logger=_LOGGER,
+            context=integration_context,
+        ),
+        _set_program_soc_if_changed(
+            hass,
+            prog2_soc,
+            min_soc - 4,
+            entry=entry,
+            logger=_LOGGER,
+            context=integration_context,
+        ),
+        # prog6 was read above and is known to sit above min_soc.
+        set_program_soc(
+            hass,
+            prog6_soc,
+            min_soc,
+            entry=entry,
+            logger=_LOGGER,
+            context=integration_context,
+        ),
     )
 
     summary = "Normal operation restored"
@@ -448,8 +487,12 @@ async def _handle_normal_restoration(
             "afternoon_grid_assist": grid_assist_on,
         },
         entities_changed=[
-            {"entity_id": prog1_soc, "value": min_soc},
-            {"entity_id": prog2_soc, "value": min_soc - 4},
+            *_written_entities(
+                (
+                    (prog1_soc, min_soc, prog1_written),
+                    (prog2_soc, min_soc - 4, prog2_written),
+                )
+            ),
             {"entity_id": prog6_soc, "value": min_soc},
         ],
     )
@@ -491,14 +534,11 @@ def _collect_balancing_data(
         days_since_balancing >= balancing_interval_days
     )
 
-    pv_forecast = 0.0
-    pv_forecast_entity = config.get(CONF_PV_FORECAST_TOMORROW)
-    if pv_forecast_entity:
-        pv_value, pv_raw, pv_error = get_float_state_info(hass, pv_forecast_entity)
-        if pv_error is None and pv_value is not None:
-            pv_forecast = pv_value
-        elif pv_error == "invalid":
-            _LOGGER.warning("Could not parse PV forecast: %s", pv_raw)
+    pv_forecast = _read_float_or_warn(
+        hass, config.get(CONF_PV_FORECAST_TOMORROW), "PV forecast"
+    )
+    if pv_forecast is None:
+        pv_forecast = 0.0
 
     pv_with_efficiency, _ = get_pv_forecast_window(
         hass,
@@ -547,7 +587,8 @@ async def _calculate_preservation_context(
     hourly_usage = build_hourly_usage_array(config, hass.states.get, daily_load_fallback=None)
     start_hour = 22
     tariff_end_hour = resolve_tariff_end_hour(hass, config)
-    hours = max(len(build_hour_window(start_hour, tariff_end_hour)), 1)
+    hour_window = build_hour_window(start_hour, tariff_end_hour)
+    hours = max(len(hour_window), 1)
 
     heat_pump_window_kwh, heat_pump_hourly = await get_heat_pump_forecast_window(
         hass, config, start_hour=start_hour, end_hour=tariff_end_hour
@@ -581,11 +622,14 @@ async def _calculate_preservation_context(
         required_sufficiency_kwh,
         pv_sufficiency_kwh,
     )
-    heat_pump_to_sufficiency_kwh = 0.0
-    for hour in build_hour_window(start_hour, tariff_end_hour):
-        if sufficiency_reached and hour == sufficiency_hour:
-            break
-        heat_pump_to_sufficiency_kwh += heat_pump_hourly.get(hour, 0.0)
+    hours_to_sufficiency = (
+        hour_window[: hour_window.index(sufficiency_hour)]
+        if sufficiency_reached
+        else hour_window
+    )
+    heat_pump_to_sufficiency_kwh = sum(
+        (heat_pump_hourly.get(hour, 0.0) for hour in hours_to_sufficiency), 0.0
+    )
 
     reserve_insufficient = reserve_kwh < needed_reserve_sufficiency_kwh
 
@@ -632,39 +676,40 @@ async def _calculate_preservation_context(
         battery_config.voltage,
     )
 
-    _LOGGER.debug(
-        "Battery space: %.2f kWh, PV forecast (90%%): %.2f kWh",
-        battery_space,
-        pv_with_efficiency,
-    )
-    _LOGGER.debug(
-        "Reserve until sufficiency: reserve=%.2f kWh, needed_reserve=%.2f kWh, "
-        "pv_to_sufficiency=%.2f kWh, heat_pump_to_sufficiency=%.2f kWh, "
-        "sufficiency=%s, grid_assist=%s",
-        reserve_kwh,
-        needed_reserve_sufficiency_kwh,
-        pv_sufficiency_kwh,
-        heat_pump_to_sufficiency_kwh,
-        format_sufficiency_hour(
-            sufficiency_hour,
-            sufficiency_reached=sufficiency_reached,
-        ),
-        grid_assist_on,
-    )
-    _LOGGER.debug(
-        "Heat pump forecast in preservation window: %.2f kWh",
-        heat_pump_window_kwh,
-    )
-    _LOGGER.debug(
-        "Morning reserve target: morning_window=%02d:00-%02d:00, "
-        "morning_needed_reserve=%.2f kWh, morning_target_soc=%.1f%% "
-        "(clamped from %.1f%%)",
-        MORNING_START_HOUR,
-        morning_end_hour,
-        morning_needed_reserve_kwh,
-        morning_target_soc,
-        unclamped_morning_target_soc,
-    )
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Battery space: %.2f kWh, PV forecast (90%%): %.2f kWh",
+            battery_space,
+            pv_with_efficiency,
+        )
+        _LOGGER.debug(
+            "Reserve until sufficiency: reserve=%.2f kWh, needed_reserve=%.2f kWh, "
+            "pv_to_sufficiency=%.2f kWh, heat_pump_to_sufficiency=%.2f kWh, "
+            "sufficiency=%s, grid_assist=%s",
+            reserve_kwh,
+            needed_reserve_sufficiency_kwh,
+            pv_sufficiency_kwh,
+            heat_pump_to_sufficiency_kwh,
+            format_sufficiency_hour(
+                sufficiency_hour,
+                sufficiency_reached=sufficiency_reached,
+            ),
+            grid_assist_on,
+        )
+        _LOGGER.debug(
+            "Heat pump forecast in preservation window: %.2f kWh",
+            heat_pump_window_kwh,
+        )
+        _LOGGER.debug(
+            "Morning reserve target: morning_window=%02d:00-%02d:00, "
+            "morning_needed_reserve=%.2f kWh, morning_target_soc=%.1f%% "
+            "(clamped from %.1f%%)",
+            MORNING_START_HOUR,
+            morning_end_hour,
+            morning_needed_reserve_kwh,
+            morning_target_soc,
+            unclamped_morning_target_soc,
+        )
 
     return PreservationContext(
         reserve_kwh=reserve_kwh,
@@ -832,10 +877,11 @@ async def async_run_evening_behavior(
     config = entry.data
     bc = get_battery_config(config)
 
+    entry_data = get_entry_data(hass, entry.entry_id) or {}
     pv_compensation_details = _update_pv_compensation(
         hass,
         config,
-        entry_id=entry.entry_id,
+        entry_data=entry_data,
     )
 
     prog1_soc = config.get(CONF_PROG1_SOC_ENTITY)
@@ -843,14 +889,9 @@ async def async_run_evening_behavior(
     prog6_soc = config.get(CONF_PROG6_SOC_ENTITY)
     max_charge_current_entity = config.get(CONF_MAX_CHARGE_CURRENT_ENTITY)
 
-    entry_data = get_entry_data(hass, entry.entry_id)
-    last_balancing_sensor = None if entry_data is None else entry_data.get("last_balancing_sensor")
-    balancing_ongoing_sensor = (
-        None if entry_data is None else entry_data.get("balancing_ongoing_sensor")
-    )
-    afternoon_grid_assist_sensor = (
-        None if entry_data is None else entry_data.get("afternoon_grid_assist_sensor")
-    )
+    last_balancing_sensor = entry_data.get("last_balancing_sensor")
+    balancing_ongoing_sensor = entry_data.get("balancing_ongoing_sensor")
+    afternoon_grid_assist_sensor = entry_data.get("afternoon_grid_assist_sensor")
     if last_balancing_sensor is None:
         _LOGGER.warning(
             "Last balancing sensor not yet initialized. "
@@ -864,9 +905,6 @@ async def async_run_evening_behavior(
         last_balancing_sensor=last_balancing_sensor,
     )
 
-    if balancing_ongoing_sensor is not None:
-        balancing_ongoing_sensor.set_ongoing(False)
-
     if await _handle_balancing(
         hass,
         entry,
@@ -885,6 +923,9 @@ async def async_run_evening_behavior(
     ):
         return
 
+    if balancing_ongoing_sensor is not None:
+        balancing_ongoing_sensor.set_ongoing(False)
+
     preservation_margin = 1.1
     await _run_non_balancing_flow(
         hass,
@@ -1,6 +1,7 @@
 """Evening peak sell decision logic."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
@@ -10,7 +11,7 @@ from ..calculations.energy import (
     calculate_sufficiency_window,
     calculate_surplus_energy,
 )
-from ..calculations.utils import build_hourly_usage_array
+from ..calculations.utils import build_hourly_usage_array, sum_hourly_window
 from ..const import (
     CONF_EVENING_MAX_PRICE_SENSOR,
     CONF_MAX_EXPORT_POWER,
@@ -23,12 +24,13 @@ from ..const import (
     CONF_MIN_ARBITRAGE_PRICE,
 )
 from ..decision_engine.common import (
+    EntityState,
     ForecastData,
     build_evening_sell_outcome,
     build_no_action_outcome,
     build_surplus_sell_outcome,
     compute_sufficiency,
-    get_required_prog5_soc_state,
+    get_required_prog_soc_state,
 )
 from ..helpers import (
     get_required_float_state,
@@ -87,8 +89,8 @@ class EveningSellStrategy(BaseSellStrategy):
     def clamp_surplus_to_pv(self) -> bool:
         return True
 
-    def _get_prog_soc_state(self) -> tuple[str, float] | None:
-        return get_required_prog5_soc_state(self.hass, self.config)
+    def _get_prog_soc_state(self) -> EntityState | None:
+        return get_required_prog_soc_state(self.hass, self.config, 5)
 
     def _get_price(self) -> float | None:
         self._resolve_window_context()
@@ -286,7 +288,7 @@ class EveningSellStrategy(BaseSellStrategy):
             self.hass.states.get,
             daily_load_fallback=None,
         )
-        usage_kwh = sum(hourly_usage[hour] for hour in hours_window)
+        usage_kwh = sum_hourly_window(hourly_usage, hours_window)
 
         heat_pump_kwh, _ = await get_heat_pump_forecast_window(
             self.hass,
@@ -429,12 +431,24 @@ class EveningSellStrategy(BaseSellStrategy):
         )
 
         tomorrow_end = resolve_tariff_end_hour(self.hass, self.config, default_hour=13)
-        tomorrow_hp_kwh, tomorrow_hp_hourly = await get_heat_pump_forecast_window(
-            self.hass,
-            self.config,
-            start_hour=0,
-            end_hour=tomorrow_end,
+        today_start = (self._now_hour + 1) % 24
+        today_end = 24
+        tomorrow_hp, today_hp = await asyncio.gather(
+            get_heat_pump_forecast_window(
+                self.hass,
+                self.config,
+                start_hour=0,
+                end_hour=tomorrow_end,
+            ),
+            get_heat_pump_forecast_window(
+                self.hass,
+                self.config,
+                start_hour=today_start,
+                end_hour=today_end,
+            ),
         )
+        tomorrow_hp_kwh, tomorrow_hp_hourly = tomorrow_hp
+        today_hp_kwh, today_hp_hourly = today_hp
         tomorrow_pv_kwh, tomorrow_pv_hourly = get_pv_forecast_window(
             self.hass,
             self.config,
@@ -450,7 +464,7 @@ class EveningSellStrategy(BaseSellStrategy):
             hours=max(tomorrow_end, 1),
         )
         tomorrow_hour_window = build_hour_window(0, tomorrow_end)
-        tomorrow_usage_kwh = sum(hourly_usage[hour] for hour in tomorrow_hour_window)
+        tomorrow_usage_kwh = sum_hourly_window(hourly_usage, tomorrow_hour_window)
         tomorrow_forecasts = ForecastData(
             start_hour=0,
             end_hour=tomorrow_end,
@@ -470,18 +484,10 @@ class EveningSellStrategy(BaseSellStrategy):
             calculator=calculate_sufficiency_window,
         )
 
-        today_start = (self._now_hour + 1) % 24
-        today_end = 24
         today_window = build_hour_window(today_start, today_end)
         today_hours = max(len(today_window), 1)
 
-        today_usage_kwh = sum(hourly_usage[hour] for hour in today_window)
-        today_hp_kwh, today_hp_hourly = await get_heat_pump_forecast_window(
-            self.hass,
-            self.config,
-            start_hour=today_start,
-            end_hour=today_end,
-        )
+        today_usage_kwh = sum_hourly_window(hourly_usage, today_window)
         today_pv_kwh, today_pv_hourly = get_pv_forecast_window(
             self.hass,
             self.config,
@@ -20,6 +20,7 @@ from ..decision_engine.common import (
     BatteryConfig,
     ChargeAction,
     EnergyBalance,
+    EntityState,
     ForecastData,
     SufficiencyResult,
     _compute_arbitrage_from_cap,
@@ -27,7 +28,7 @@ from ..decision_engine.common import (
     build_morning_charge_outcome,
     calculate_target_soc_from_needed_reserve,
     compute_sufficiency,
-    get_required_prog2_soc_state,
+    get_required_prog_soc_state,
     handle_no_action_soc_update,
 )
 from ..helpers import (
@@ -53,9 +54,9 @@ class MorningChargeStrategy(BaseChargeStrategy):
         """Scenario display name."""
         return "Morning Grid Charge"
 
-    def _get_prog_soc_state(self) -> tuple[str, float] | None:
+    def _get_prog_soc_state(self) -> EntityState | None:
         """Resolve morning Program 2 SOC state."""
-        return get_required_prog2_soc_state(self.hass, self.config)
+        return get_required_prog_soc_state(self.hass, self.config, 2)
 
     def _resolve_forecast_params(self) -> tuple[int, int, dict[str, object]]:
         """Resolve morning forecast time window and kwargs."""
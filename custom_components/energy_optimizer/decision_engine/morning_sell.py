@@ -12,14 +12,15 @@ from ..calculations.energy import (
     calculate_sufficiency_window,
     calculate_surplus_energy,
 )
-from ..calculations.utils import build_hourly_usage_array
+from ..calculations.utils import build_hourly_usage_array, sum_hourly_window
 from ..const import CONF_EVENING_MAX_PRICE_SENSOR, CONF_MORNING_MAX_PRICE_SENSOR, DOMAIN, SUN_ENTITY
 from ..decision_engine.common import (
+    EntityState,
     ForecastData,
     build_evening_sell_outcome,
     build_no_action_outcome,
     compute_sufficiency,
-    get_required_prog3_soc_state,
+    get_required_prog_soc_state,
 )
 from ..helpers import (
     get_float_state_info,
@@ -69,9 +70,9 @@ class MorningSellStrategy(BaseSellStrategy):
             return self.battery_config.min_soc_pv
         return self.battery_config.min_soc
 
-    def _get_prog_soc_state(self) -> tuple[str, float] | None:
+    def _get_prog_soc_state(self) -> EntityState | None:
         """Resolve program SOC entity/value for morning sell."""
-        return get_required_prog3_soc_state(self.hass, self.config)
+        return get_required_prog_soc_state(self.hass, self.config, 3)
 
     def _get_price(self) -> float | None:
         """Resolve morning max price state."""
@@ -108,7 +109,7 @@ class MorningSellStrategy(BaseSellStrategy):
 
         base_window = build_hour_window(start_hour, base_end_hour)
         base_hours = max(len(base_window), 1)
-        base_usage_kwh = sum(hourly_usage[hour] for hour in base_window)
+        base_usage_kwh = sum_hourly_window(hourly_usage, base_window)
         base_heat_pump_kwh, base_heat_pump_hourly = await get_heat_pump_forecast_window(
             self.hass,
             self.config,
@@ -305,7 +306,7 @@ class MorningSellStrategy(BaseSellStrategy):
                         surplus_end_hour = dt_util.as_local(next_setting_dt).hour
             surplus_window = build_hour_window(start_hour, surplus_end_hour)
             surplus_hours = max(len(surplus_window), 1)
-            surplus_usage_kwh = sum(hourly_usage[hour] for hour in surplus_window)
+            surplus_usage_kwh = sum_hourly_window(hourly_usage, surplus_window)
             surplus_heat_pump_kwh, surplus_heat_pump_hourly = await get_heat_pump_forecast_window(
                 self.hass,
                 self.config,
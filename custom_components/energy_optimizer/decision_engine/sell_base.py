@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import asyncio
 from collections.abc import Callable
 from dataclasses import dataclass
 import logging
@@ -29,6 +30,7 @@ from ..helpers import get_float_state_info, is_test_sell_mode
 from ..utils.logging import DecisionOutcome, log_decision_unified
 from .common import (
     BatteryConfig,
+    EntityState,
     get_battery_config,
     get_required_current_soc_state,
     resolve_entry,
@@ -99,7 +101,7 @@ class BaseSellStrategy(ABC):
         return self.battery_config.min_soc
 
     @abstractmethod
-    def _get_prog_soc_state(self) -> tuple[str, float] | None:
+    def _get_prog_soc_state(self) -> EntityState | None:
         """Return configured program SOC entity and current value."""
 
     @abstractmethod
@@ -311,21 +313,23 @@ class BaseSellStrategy(ABC):
                         self.sell_type,
                     )
 
-            await set_program_soc(
-                self.hass,
-                self.prog_soc_entity,
-                target_soc,
-                entry=self.entry,
-                logger=_LOGGER,
-                context=self.integration_context,
-            )
-            await set_export_power(
-                self.hass,
-                str(export_power_entity) if export_power_entity else None,
-                export_power_w,
-                entry=self.entry,
-                logger=_LOGGER,
-                context=self.integration_context,
+            await asyncio.gather(
+                set_program_soc(
+                    self.hass,
+                    self.prog_soc_entity,
+                    target_soc,
+                    entry=self.entry,
+                    logger=_LOGGER,
+                    context=self.integration_context,
+                ),
+                set_export_power(
+                    self.hass,
+                    str(export_power_entity) if export_power_entity else None,
+                    export_power_w,
+                    entry=self.entry,
+                    logger=_LOGGER,
+                    context=self.integration_context,
+                ),
             )
 
         outcome = request.build_outcome_fn(target_soc, surplus_kwh, export_power_w)
@@ -374,6 +374,7 @@ class OptimizationHistorySensor(EnergyOptimizerSensor, RestoreSensor):
     _attr_unique_id = "optimization_history"
     _attr_icon = "mdi:history"
     _attr_native_value: str = "No optimizations yet"
+    _unrecorded_attributes = frozenset({"history"})
 
     def __init__(
         self,
@@ -434,6 +435,6 @@ class OptimizationHistorySensor(EnergyOptimizerSensor, RestoreSensor):
             **details,
         }
         self._history.insert(0, entry)
-        self._history = self._history[:20]
+        del self._history[20:]
         self._attr_native_value = f"{scenario} - {details.get('result', 'completed')}"
         self.async_write_ha_state()
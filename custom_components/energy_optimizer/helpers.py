@@ -7,6 +7,31 @@ from typing import TYPE_CHECKING, Any, Literal
 
 from homeassistant.util import dt as dt_util
 
+from .const import (
+    CONF_DAYTIME_MIN_PRICE_HOUR_SENSOR,
+    CONF_EVENING_MAX_PRICE_HOUR_SENSOR,
+    CONF_EVENING_SECOND_MAX_PRICE_HOUR_SENSOR,
+    CONF_HIGH_TARIFF_END_HOUR_SENSOR,
+    CONF_HIGH_TARIFF_START_HOUR_SENSOR,
+    CONF_MORNING_MAX_PRICE_HOUR_SENSOR,
+    CONF_PROG1_SOC_ENTITY,
+    CONF_PROG1_TIME_START_ENTITY,
+    CONF_PROG2_SOC_ENTITY,
+    CONF_PROG2_TIME_START_ENTITY,
+    CONF_PROG3_SOC_ENTITY,
+    CONF_PROG3_TIME_START_ENTITY,
+    CONF_PROG4_SOC_ENTITY,
+    CONF_PROG4_TIME_START_ENTITY,
+    CONF_PROG5_SOC_ENTITY,
+    CONF_PROG5_TIME_START_ENTITY,
+    CONF_PROG6_SOC_ENTITY,
+    CONF_PROG6_TIME_START_ENTITY,
+    CONF_TEST_MODE,
+    CONF_TEST_SELL_MODE,
+    CONF_USE_PV_FORECAST_COMPENSATION,
+    DOMAIN,
+)
+
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from homeassistant.config_entries import ConfigEntry
@@ -15,8 +40,6 @@ _LOGGER = logging.getLogger(__name__)
 
 def is_test_mode(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Return True when test mode is enabled for the config entry."""
-    from .const import CONF_TEST_MODE, DOMAIN
-
     entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
     if isinstance(entry_data, dict):
         test_mode_switch = entry_data.get("test_mode_switch")
@@ -30,8 +53,6 @@ def is_test_mode(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 def is_test_sell_mode(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Return True when test sell mode is enabled for the config entry."""
-    from .const import CONF_TEST_SELL_MODE, DOMAIN
-
     entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
     if isinstance(entry_data, dict):
         test_sell_mode_switch = entry_data.get("test_sell_mode_switch")
@@ -47,8 +68,6 @@ def is_pv_forecast_compensation_enabled(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> bool:
     """Return True when PV forecast compensation sensor usage is enabled."""
-    from .const import CONF_USE_PV_FORECAST_COMPENSATION, DOMAIN
-
     entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
     if isinstance(entry_data, dict):
         pv_comp_switch = entry_data.get("pv_forecast_compensation_switch")
@@ -62,8 +81,6 @@ def is_pv_forecast_compensation_enabled(
 
 def is_balancing_ongoing(hass: HomeAssistant, entry_id: str) -> bool:
     """Return True when balancing ongoing binary sensor is on."""
-    from .const import DOMAIN
-
     entry_data = hass.data.get(DOMAIN, {}).get(entry_id)
     if not isinstance(entry_data, dict):
         return False
@@ -76,8 +93,6 @@ def set_balancing_ongoing(
     hass: HomeAssistant, entry_id: str, *, ongoing: bool
 ) -> None:
     """Set balancing ongoing flag when sensor is available."""
-    from .const import DOMAIN
-
     entry_data = hass.data.get(DOMAIN, {}).get(entry_id)
     if not isinstance(entry_data, dict):
         return
@@ -99,16 +114,6 @@ def get_active_program_entity(
     Returns:
         Entity ID of the active program, or None if no programs configured or no match
     """
-    from datetime import time as dt_time
-    from .const import (
-        CONF_PROG1_SOC_ENTITY, CONF_PROG1_TIME_START_ENTITY,
-        CONF_PROG2_SOC_ENTITY, CONF_PROG2_TIME_START_ENTITY,
-        CONF_PROG3_SOC_ENTITY, CONF_PROG3_TIME_START_ENTITY,
-        CONF_PROG4_SOC_ENTITY, CONF_PROG4_TIME_START_ENTITY,
-        CONF_PROG5_SOC_ENTITY, CONF_PROG5_TIME_START_ENTITY,
-        CONF_PROG6_SOC_ENTITY, CONF_PROG6_TIME_START_ENTITY,
-    )
-    
     programs = [
         (CONF_PROG1_SOC_ENTITY, CONF_PROG1_TIME_START_ENTITY),
         (CONF_PROG2_SOC_ENTITY, CONF_PROG2_TIME_START_ENTITY),
@@ -168,7 +173,7 @@ def get_active_program_entity(
             
             time_parts = time_value.split(":")
             if len(time_parts) >= 2:
-                start_dt = dt_time(int(time_parts[0]), int(time_parts[1]))
+                start_dt = time(int(time_parts[0]), int(time_parts[1]))
                 _LOGGER.debug("Successfully parsed time for %s: %s -> %s", soc_key, time_value, start_dt)
             else:
                 _LOGGER.warning("Invalid time format for %s: %s (expected HH:MM or HH:MM:SS)", start_time_entity_id, time_value)
@@ -315,8 +320,6 @@ def resolve_tariff_end_hour(
     default_hour: int = 13,
 ) -> int:
     """Resolve high tariff end hour from configured sensor with fallback."""
-    from .const import CONF_HIGH_TARIFF_END_HOUR_SENSOR
-
     tariff_end_hour = default_hour
     tariff_end_entity = config.get(CONF_HIGH_TARIFF_END_HOUR_SENSOR)
     if tariff_end_entity:
@@ -363,8 +366,6 @@ def resolve_tariff_start_hour(
     default_hour: int = 15,
 ) -> int:
     """Resolve high tariff start hour from configured sensor with fallback."""
-    from .const import CONF_HIGH_TARIFF_START_HOUR_SENSOR
-
     tariff_start_hour = default_hour
     tariff_start_entity = config.get(CONF_HIGH_TARIFF_START_HOUR_SENSOR)
     if tariff_start_entity:
@@ -411,8 +412,6 @@ def resolve_evening_max_price_hour(
     default_hour: int = 17,
 ) -> int:
     """Resolve evening max price hour from configured sensor with fallback."""
-    from .const import CONF_EVENING_MAX_PRICE_HOUR_SENSOR
-
     evening_peak_hour = default_hour
     evening_peak_entity = config.get(CONF_EVENING_MAX_PRICE_HOUR_SENSOR)
     if evening_peak_entity:
@@ -460,8 +459,6 @@ def resolve_evening_second_max_price_hour(
 
     Returns None when not configured or sensor unavailable.
     """
-    from .const import CONF_EVENING_SECOND_MAX_PRICE_HOUR_SENSOR
-
     entity = config.get(CONF_EVENING_SECOND_MAX_PRICE_HOUR_SENSOR)
     if not entity:
         return None
@@ -498,8 +495,6 @@ def resolve_morning_max_price_hour(
     default_hour: int = 7,
 ) -> int:
     """Resolve morning max price hour from configured sensor with fallback."""
-    from .const import CONF_MORNING_MAX_PRICE_HOUR_SENSOR
-
     morning_peak_hour = default_hour
     morning_peak_entity = config.get(CONF_MORNING_MAX_PRICE_HOUR_SENSOR)
     if morning_peak_entity:
@@ -545,8 +540,6 @@ def resolve_daytime_min_price_time(
     default_time: str = "12:00",
 ) -> time:
     """Resolve daytime minimum price time (HH:MM) from configured sensor with fallback."""
-    from .const import CONF_DAYTIME_MIN_PRICE_HOUR_SENSOR
-
     def _normalize_to_time(raw_value: object) -> time | None:
         dt_value = dt_util.parse_datetime(str(raw_value))
         if dt_value is not None:
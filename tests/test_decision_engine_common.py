@@ -1,15 +1,21 @@
 """Tests for decision engine common helpers."""
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from custom_components.energy_optimizer.decision_engine.common import resolve_entry
+from custom_components.energy_optimizer.decision_engine.common import (
+    get_entry_data,
+    handle_no_action_soc_update,
+    resolve_entry,
+)
 from custom_components.energy_optimizer.const import DOMAIN
 
 pytestmark = pytest.mark.enable_socket
 
+COMMON = "custom_components.energy_optimizer.decision_engine.common"
+
 
 def _mock_entry(entry_id: str, domain: str = DOMAIN) -> MagicMock:
     entry = MagicMock()
@@ -65,3 +71,50 @@ def test_resolve_entry_no_entries() -> None:
     result = resolve_entry(hass, None)
 
     assert result is None
+
+
+def test_get_entry_data_returns_dict_or_none() -> None:
+    hass = MagicMock()
+    hass.data = {DOMAIN: {"abc": {"key": "value"}, "bad": object()}}
+
+    assert get_entry_data(hass, "abc") == {"key": "value"}
+    assert get_entry_data(hass, "bad") is None
+    assert get_entry_data(hass, "missing") is None
+
+    hass.data = {}
+    assert get_entry_data(hass, "abc") is None
+
+
+@pytest.mark.parametrize(
+    ("target_soc", "current_prog_soc", "expect_write"),
+    [(57.3, 58.0, False), (58.0, 58.0, False), (58.2, 58.0, True), (40.0, 58.0, True)],
+)
+async def test_handle_no_action_soc_update_skips_unchanged_write(
+    monkeypatch: pytest.MonkeyPatch,
+    target_soc: float,
+    current_prog_soc: float,
+    expect_write: bool,
+) -> None:
+    set_soc = AsyncMock()
+    monkeypatch.setattr(f"{COMMON}.set_program_soc", set_soc)
+    monkeypatch.setattr(f"{COMMON}.log_decision_unified", AsyncMock())
+    outcome = MagicMock()
+    outcome.entities_changed = None
+
+    await handle_no_action_soc_update(
+        MagicMock(),
+        _mock_entry("abc"),
+        integration_context=MagicMock(),
+        prog_soc_entity="number.prog2_soc",
+        current_prog_soc=current_prog_soc,
+        target_soc=target_soc,
+        outcome=outcome,
+    )
+
+    assert set_soc.await_count == int(expect_write)
+    if expect_write:
+        assert outcome.entities_changed == [
+            {"entity_id": "number.prog2_soc", "value": target_soc}
+        ]
+    else:
+        assert outcome.entities_changed is None
@@ -106,6 +106,22 @@ async def test_evening_behavior_balancing_triggers_program_updates() -> None:
     assert "number.max_charge_current" in entities
 
 
+@pytest.mark.asyncio
+async def test_evening_behavior_balancing_sets_ongoing_once() -> None:
+    config = {
+        CONF_PROG1_SOC_ENTITY: "number.prog1_soc",
+        CONF_PV_FORECAST_TOMORROW: "sensor.pv_forecast",
+        CONF_BALANCING_PV_THRESHOLD: 20.5,
+    }
+    hass = _setup_hass(config, {"sensor.pv_forecast": "0"})
+    balancing_ongoing_sensor = MagicMock()
+    hass.data[DOMAIN]["entry-1"]["balancing_ongoing_sensor"] = balancing_ongoing_sensor
+
+    await async_run_evening_behavior(hass, entry_id="entry-1")
+
+    balancing_ongoing_sensor.set_ongoing.assert_called_once_with(True)
+
+
 def _base_preservation_config() -> dict[str, object]:
     return {
         CONF_BATTERY_SOC_SENSOR: "sensor.battery_soc",
@@ -381,3 +397,59 @@ async def test_handle_preservation_grid_assist_uses_morning_target_soc(
     assert details["target_soc"] == 35.0
     assert details["morning_target_soc"] == 35.0
     assert details["morning_needed_reserve_kwh"] == 3.52
+
+
+@pytest.mark.asyncio
+async def test_handle_preservation_skips_program_already_at_target(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    config = _base_preservation_config()
+    hass = _setup_hass(
+        config,
+        {
+            "sensor.battery_soc": "68",
+            "number.prog1_soc": "35",
+            "number.prog6_soc": "50",
+        },
+    )
+    entry = hass.config_entries.async_get_entry("entry-1")
+
+    set_program_soc_mock = AsyncMock()
+    log_mock = AsyncMock()
+    monkeypatch.setattr(f"{EVENING}.set_program_soc", set_program_soc_mock)
+    monkeypatch.setattr(f"{EVENING}.log_decision_unified", log_mock)
+
+    activated = await _handle_preservation(
+        hass,
+        entry,
+        integration_context=MagicMock(),
+        grid_assist_on=True,
+        reserve_insufficient=False,
+        pv_with_efficiency=50.0,
+        battery_space=1.0,
+        prog1_soc="number.prog1_soc",
+        prog6_soc="number.prog6_soc",
+        current_soc=68.0,
+        morning_target_soc=34.2,
+        morning_needed_reserve_kwh=3.52,
+        pv_forecast=5.0,
+        heat_pump_window_kwh=4.11,
+        heat_pump_to_sufficiency_kwh=1.23,
+        reserve_kwh=8.0,
+        required_kwh=10.0,
+        required_sufficiency_kwh=4.0,
+        pv_sufficiency_kwh=1.0,
+        needed_reserve_sufficiency_kwh=3.0,
+        sufficiency_hour=8,
+        sufficiency_reached=True,
+        pv_forecast_window_kwh=12.0,
+        pv_compensation_details={},
+    )
+
+    assert activated is True
+    assert set_program_soc_mock.await_count == 1
+    assert set_program_soc_mock.await_args.args[1] == "number.prog6_soc"
+    outcome = log_mock.await_args.args[2]
+    assert outcome.entities_changed == [
+        {"entity_id": "number.prog6_soc", "value": 34.2}
+    ]
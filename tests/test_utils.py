@@ -5,6 +5,7 @@ from custom_components.energy_optimizer.calculations.utils import (
     interpolate,
     is_valid_percentage,
     safe_float,
+    sum_hourly_window,
 )
 
 
@@ -213,3 +214,11 @@ def test_build_hourly_usage_array_invalid_state():
     
     # Should fall back to daily average for invalid window
     assert all(result[i] == 2.0 for i in range(0, 4))
+
+
+def test_sum_hourly_window():
+    """Test summing an hourly array over a wrapped window."""
+    hourly = [float(hour) for hour in range(24)]
+
+    assert sum_hourly_window(hourly, [22, 23, 0, 1]) == 46.0
+    assert sum_hourly_window(hourly, []) == 0